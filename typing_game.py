@@ -1,24 +1,22 @@
+import math
 import os
+import queue
 import random
+import string
+import threading
 import time
 
-# --- Platform-specific non-blocking input ---
-# This is necessary for the real-time timer. It allows the game to
-# check for keystrokes without pausing the entire program.
+# --- Platform-specific blocking reads ---
+# Keyboard input is read on a background thread (below), so each
+# platform only needs a truly blocking single-character read; no polling
+# and no platform-specific wait-with-timeout machinery.
 IS_WINDOWS = False
 try:
     # Posix (Linux, macOS)
+    import codecs
     import sys
     import tty
     import termios
-    import select
-
-    def get_char_non_blocking():
-        """Reads a single character from stdin without blocking."""
-        # Check if there's input to be read
-        if select.select([sys.stdin], [], [], 0) == ([sys.stdin], [], []):
-            return sys.stdin.read(1)
-        return None
 
     # We need to set the terminal to "cbreak" mode to read characters
     # instantly without waiting for the user to press Enter.
@@ -26,9 +24,31 @@ try:
     fd = sys.stdin.fileno()
     old_settings = termios.tcgetattr(fd)
 
+    # Incremental decoder for the raw byte stream: it holds partial
+    # multibyte UTF-8 sequences between reads and substitutes U+FFFD for
+    # invalid bytes, so a stray non-ASCII keystroke can never collapse
+    # to '' and be mistaken for EOF by the reader thread.
+    _stdin_decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+
+    def _read_char_blocking():
+        """Blocks until at least one character is available on stdin.
+
+        Returns '' only on a true end-of-file.
+        """
+        # Read the raw fd directly: one syscall per byte, skipping
+        # TextIOWrapper's buffering, locking, and chunk logic.
+        while True:
+            data = os.read(fd, 1)
+            if not data:
+                return ''  # EOF
+            chars = _stdin_decoder.decode(data)
+            if chars:
+                return chars
+
     def setup_terminal():
-        """Puts the terminal into cbreak mode."""
+        """Puts the terminal into cbreak mode and starts the reader."""
         tty.setcbreak(sys.stdin.fileno())
+        _start_reader()
 
     def restore_terminal():
         """Restores the terminal to its original settings."""
@@ -39,27 +59,95 @@ except ImportError:
     import msvcrt
     IS_WINDOWS = True
 
-    def get_char_non_blocking():
-        """Reads a single character from stdin without blocking on Windows."""
-        if msvcrt.kbhit():
-            # getch() returns a byte string, so we decode it
-            return msvcrt.getch().decode('utf-8', errors='ignore')
-        return None
+    def _read_char_blocking():
+        """Blocks until one character is available on the console."""
+        return msvcrt.getwch()
 
     def setup_terminal():
-        """No setup needed for Windows."""
-        pass
+        """Starts the input reader; no terminal mode changes needed."""
+        _start_reader()
 
     def restore_terminal():
         """No teardown needed for Windows."""
         pass
 
+# --- Background input reader ---
+# A daemon thread sits in a blocking one-character read and pushes
+# keystrokes onto a queue. The main thread consumes them with a timeout,
+# so input latency and render cadence no longer trade off against each
+# other. The thread is started lazily from setup_terminal() so it can't
+# swallow the Enter press on the welcome screen.
+_input_queue = queue.SimpleQueue()
+_reader_thread = None
+
+def _reader():
+    while True:
+        chars = _read_char_blocking()
+        if not chars:
+            break  # EOF
+        # A read can yield more than one character (e.g. a replacement
+        # character flushed together with the keystroke that followed an
+        # invalid byte); queue them individually.
+        for char in chars:
+            _input_queue.put(char)
+
+def _start_reader():
+    """Starts the keyboard reader thread (idempotent)."""
+    global _reader_thread
+    if _reader_thread is None:
+        _reader_thread = threading.Thread(target=_reader, daemon=True)
+        _reader_thread.start()
+
+def wait_for_char(timeout):
+    """Waits up to `timeout` seconds for a keystroke.
+
+    Sleeps in the queue's internal lock until the reader thread delivers
+    a character or the timeout expires. Returns the character, or None
+    on timeout.
+    """
+    try:
+        return _input_queue.get(timeout=max(0, timeout))
+    except queue.Empty:
+        return None
+
+# --- Optional NumPy acceleration ---
+# Used for the vectorized prefix check behind the live input feedback;
+# without NumPy a plain startswith() fallback runs instead.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# --- Optional Numba acceleration ---
+# The per-frame timer arithmetic is compiled with Numba when it is
+# installed; otherwise the decorator degrades to a no-op and the plain
+# Python version runs identically.
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
 # --- Game Configuration ---
 TOTAL_LEVELS = 25
 STARTING_LIVES = 3
 TIME_PER_LEVEL = 60  # in seconds
 WORDS_PER_BOSS = 10
 POINTS_PER_BOSS = 100
+MAX_FPS = 30  # cap on how often the screen is redrawn
+
+# Characters accepted as typing input. The word lists contain only ASCII
+# letters, and a frozenset membership test is a single hash lookup where
+# str.isprintable() walks the Unicode category tables on every keystroke.
+_PRINTABLE = frozenset(string.ascii_letters)
+
+@njit(cache=True)
+def _tick(start, now, typed, total, per_level):
+    """Computes (elapsed, time_left, words_left) for one frame."""
+    elapsed = now - start
+    return elapsed, per_level - elapsed, total - typed
 
 # --- ASCII Art for Bosses ---
 # A list of tuples, where each tuple contains the boss name and its ASCII art.
@@ -243,6 +331,12 @@ BOSSES = [
     """)
 ]
 
+# Pre-encode each boss banner (header plus art) into a single bytes blob
+# at import time, so showing a boss is one buffered write with no string
+# formatting at display time.
+BOSSES_RENDERED = [f"\n--- BOSS: {name} ---\n{art}\n".encode()
+                   for name, art in BOSSES]
+
 # --- Word Lists by Difficulty ---
 WORDS = {
     "easy": [
@@ -293,12 +387,59 @@ WORDS = {
     ]
 }
 
+# Normalize the word lists once at import time: lowercase every word and
+# freeze each list into a tuple. Keystrokes are lowercased as they are
+# typed, so the Enter-key comparison never has to call .lower() on the
+# hot path.
+WORDS = {difficulty: tuple(word.lower() for word in words)
+         for difficulty, words in WORDS.items()}
+
+# Structure-of-arrays word tables for the live input feedback. Each
+# difficulty's words are padded with NUL bytes to a common length and
+# stacked into one (N, MAXLEN) uint8 array, so checking whether the
+# typed prefix still matches the target word is a single vectorized
+# slice compare instead of a per-character Python loop.
+if np is not None:
+    _WORD_TABLE = {}
+    _WORD_ROW = {}
+    for _difficulty, _words in WORDS.items():
+        _maxlen = max(len(w) for w in _words)
+        _packed = b''.join(w.encode().ljust(_maxlen, b'\x00') for w in _words)
+        _WORD_TABLE[_difficulty] = np.frombuffer(
+            _packed, dtype=np.uint8).reshape(len(_words), _maxlen)
+        for _row, _word in enumerate(_words):
+            _WORD_ROW[_word] = (_difficulty, _row)
+    del _difficulty, _words, _maxlen, _packed, _row, _word
+
+def prefix_matches(word, typed):
+    """Returns True if `typed` (a bytes-like) is a correct prefix of `word`."""
+    if not typed:
+        return True
+    if np is not None:
+        difficulty, row = _WORD_ROW[word]
+        table = _WORD_TABLE[difficulty]
+        n = len(typed)
+        if n > table.shape[1]:
+            return False
+        return bool((table[row, :n] == np.frombuffer(bytes(typed), dtype=np.uint8)).all())
+    return word.encode().startswith(bytes(typed))
+
 # --- Helper Functions ---
 
 def clear_screen():
     """Clears the terminal screen."""
     os.system('cls' if IS_WINDOWS else 'clear')
 
+# Per-difficulty shuffled index pools for word selection. Each pool is
+# shuffled once and handed out in slices of WORDS_PER_BOSS; when a slice
+# would run past the end, the pool is reshuffled and the cursor reset.
+# Cheaper than random.sample(), which copies and re-samples the whole
+# list on every call.
+_word_pools = {difficulty: list(range(len(words)))
+               for difficulty, words in WORDS.items()}
+_word_cursors = {difficulty: len(words)  # force a shuffle on first use
+                 for difficulty, words in WORDS.items()}
+
 def get_word_list(level):
     """Selects a list of random words based on the current level."""
     if 1 <= level <= 5:   difficulty = "easy"
@@ -306,43 +447,139 @@ def get_word_list(level):
     elif 13 <= level <= 20: difficulty = "hard"
     else:                   difficulty = "expert"
     available_words = WORDS[difficulty]
+    pool = _word_pools[difficulty]
     num_to_pick = min(WORDS_PER_BOSS, len(available_words))
-    return random.sample(available_words, num_to_pick)
+    cursor = _word_cursors[difficulty]
+    if cursor + num_to_pick > len(pool):
+        random.shuffle(pool)
+        cursor = 0
+    _word_cursors[difficulty] = cursor + num_to_pick
+    return tuple(available_words[i] for i in pool[cursor:cursor + num_to_pick])
+
+# Fixed HUD chrome, built once instead of per call. Lives never exceed
+# STARTING_LIVES, so every possible hearts string can be precomputed.
+_SEP = "=" * 50
+_HEARTS = tuple('❤' * i for i in range(STARTING_LIVES + 1))
 
 def display_hud(level, score, lives, time_left, words_left):
     """Displays the Heads-Up Display (HUD) with game stats."""
-    print("=" * 50)
-    print(f" Level: {level}/{TOTAL_LEVELS} | Score: {score} | Lives: {'❤' * lives}")
-    print(f" Time Left: {int(time_left):02d}s | Words to Defeat Boss: {words_left}")
-    print("=" * 50)
+    # Assemble the whole HUD and emit it in one write, instead of four
+    # print() calls each taking the stdio lock separately.
+    parts = [
+        _SEP, "\n",
+        f" Level: {level}/{TOTAL_LEVELS} | Score: {score} | Lives: {_HEARTS[lives]}\n",
+        f" Time Left: {int(time_left):02d}s | Words to Defeat Boss: {words_left}\n",
+        _SEP, "\n",
+    ]
+    sys.stdout.write(''.join(parts))
 
 def display_boss(level):
     """Displays the name and ASCII art for the current boss."""
-    boss_name, boss_art = BOSSES[level - 1]
-    print(f"\n--- BOSS: {boss_name} ---")
-    print(boss_art)
+    # Flush the text layer first so the raw write can't be reordered
+    # ahead of earlier print() output.
+    sys.stdout.flush()
+    sys.stdout.buffer.write(BOSSES_RENDERED[level - 1])
+    sys.stdout.buffer.flush()
 
 # --- Main Game Logic ---
 
-def play_level(level, current_score, current_lives):
+def play_level(level, current_score, current_lives, words_to_type):
     """
     Manages gameplay for a single level with a real-time timer.
-    This function now loops continuously, redrawing the screen and
-    checking for non-blocking input on each frame.
+    The loop blocks in wait_for_char() until a keystroke arrives or the
+    next one-second HUD tick is due, and only redraws the screen when
+    something visible actually changed. The level's word list is chosen
+    by the caller, up front, so no shuffling happens on the clock.
     """
-    start_time = time.time()
-    words_to_type = get_word_list(level)
+    # time.monotonic() is immune to wall-clock jumps (NTP adjustments,
+    # manual clock changes), so the level timer can't skip or stall.
+    start_time = time.monotonic()
     words_typed_count = 0
-    boss_name, _ = BOSSES[level - 1]
-    user_input = ""
-    
+    # The target word is kept in a local and refreshed only when a word
+    # is completed, instead of re-indexing words_to_type every frame.
+    current_word = words_to_type[0]
+    boss_name, boss_art = BOSSES[level - 1]
+    # The typed input lives in a bytearray: appending a keystroke is
+    # amortized O(1), where `str += char` copies the whole string. It is
+    # only decoded to str when rendered or compared on Enter.
+    user_buf = bytearray()
+    frame_seconds = 1 / MAX_FPS
+    next_frame_time = 0.0  # render the first frame immediately
+    force_render = False
+    # Rendering is purely event-driven: the dirty flag is raised only by
+    # a keystroke that changed the input or by the HUD second rolling
+    # over, and lowered when a frame is drawn.
+    dirty = True
+
+    # The end-of-level deadline and the next whole-second HUD tick are
+    # kept as absolute monotonic times, so keystroke wakeups can be
+    # processed without reading the clock; it is consulted only when a
+    # tick fires or a frame is actually drawn.
+    deadline = start_time + TIME_PER_LEVEL
+    next_tick = start_time + 1
+
+    # Draw the static parts of the screen once: HUD frame, boss art.
+    # Per frame we only move the cursor back and rewrite the lines that
+    # change, instead of forking a subprocess to clear the whole screen
+    # and reprinting ~30 lines of art that never changes within a level.
+    sys.stdout.write('\x1b[2J\x1b[H')
+    display_hud(level, current_score, current_lives, TIME_PER_LEVEL, len(words_to_type))
+    display_boss(level)
+    # Rows of the dynamic fields: 4 HUD rows, then the boss block (blank
+    # line, header, art lines), then a blank line before the prompt.
+    word_row = 9 + boss_art.count('\n')
+    input_row = word_row + 1
+
+    # Frame template specialized for this level: the cursor addresses
+    # and escape sequences are folded in once here, leaving a single
+    # C-level %-format for the dynamic fields on each redraw.
+    frame_template = (
+        '\x1b[?2026h'
+        '\x1b[3;1H\x1b[K Time Left: %02ds | Words to Defeat Boss: %d'
+        f'\x1b[{word_row};1H\x1b[K' 'Type this word: -> %s <-'
+        f'\x1b[{input_row};1H\x1b[K' ' > %s%s\x1b[0m'
+        '\x1b[?2026l'
+    )
+
+    # Control-character dispatch: a single dict lookup per keystroke
+    # replaces the chain of tuple-membership tests. Handlers close over
+    # the level state; _on_enter returns True when a word was completed.
+    def _on_enter():
+        nonlocal words_typed_count, current_word, force_render, dirty
+        if user_buf.decode() == current_word:
+            words_typed_count += 1
+            user_buf.clear()
+            force_render = True
+            dirty = True
+            if words_typed_count < len(words_to_type):
+                current_word = words_to_type[words_typed_count]
+            return True
+        # Incorrect word - just clear the input for now
+        if user_buf:
+            user_buf.clear()
+            dirty = True
+        return False
+
+    def _on_backspace():
+        nonlocal dirty
+        if user_buf:
+            user_buf.pop()
+            dirty = True
+        return False
+
+    def _on_interrupt():
+        raise KeyboardInterrupt
+
+    handlers = {
+        '\r': _on_enter, '\n': _on_enter,            # Enter key
+        '\x08': _on_backspace, '\x7f': _on_backspace,  # Backspace per OS
+        '\b': _on_backspace,
+        '\x03': _on_interrupt,                       # Ctrl+C
+    }
+
     while True:
-        # --- Calculate Timings and Progress ---
-        elapsed_time = time.time() - start_time
-        time_left = TIME_PER_LEVEL - elapsed_time
+        # --- Check for Win Condition ---
         words_left_to_type = len(words_to_type) - words_typed_count
-
-        # --- Check for Win/Loss Conditions ---
         if words_left_to_type <= 0:
             clear_screen()
             display_boss(level)
@@ -350,48 +587,64 @@ def play_level(level, current_score, current_lives):
             time.sleep(2)
             return (True, current_score + POINTS_PER_BOSS, current_lives)
 
-        if time_left <= 0:
-            clear_screen()
-            print("\n*** TIME'S UP! ***")
-            print("You lost a life.")
-            time.sleep(2)
-            return (False, current_score, current_lives - 1)
-
-        # --- Handle Non-Blocking Input ---
-        char = get_char_non_blocking()
-        if char:
-            if char in ('\r', '\n'):  # Enter key
-                if user_input.strip().lower() == words_to_type[words_typed_count]:
-                    words_typed_count += 1
-                    user_input = ""
+        # --- Render the Game Screen When Something Changed ---
+        # Redraw only when the dirty flag was raised, and at most MAX_FPS
+        # times per second so bursts of keystrokes coalesce into a single
+        # redraw (a completed word forces an immediate one). The clock is
+        # read only inside this branch, right before drawing.
+        if dirty:
+            now = time.monotonic()
+            if force_render or now >= next_frame_time:
+                _, time_left, words_left_to_type = _tick(
+                    start_time, now, words_typed_count, len(words_to_type), TIME_PER_LEVEL)
+                current_second = max(0, int(time_left))
+                user_input = user_buf.decode()
+                # Live feedback: input turns red the moment it stops
+                # being a correct prefix of the target word.
+                input_colour = '\x1b[32m' if prefix_matches(current_word, user_buf) else '\x1b[31m'
+                sys.stdout.write(frame_template % (
+                    current_second, words_left_to_type,
+                    current_word, input_colour, user_input))
+                sys.stdout.flush()
+
+                next_frame_time = now + frame_seconds
+                force_render = False
+                dirty = False
+
+        # --- Wait for Input or the Next Redraw Deadline ---
+        # Sleep in the OS until a key arrives or the next whole-second
+        # HUD tick, whichever comes first. If a redraw is pending but was
+        # throttled by the frame cap, wake at the frame boundary instead.
+        next_wake = next_tick if not dirty else min(next_tick, next_frame_time)
+        char = wait_for_char(next_wake - time.monotonic())
+        if char is None:
+            # Timed out: the HUD second rolled over, a throttled redraw
+            # came due, or the level timer expired.
+            now = time.monotonic()
+            if now >= deadline:
+                clear_screen()
+                print("\n*** TIME'S UP! ***")
+                print("You lost a life.")
+                time.sleep(2)
+                return (False, current_score, current_lives - 1)
+            if now >= next_tick:
+                # The HUD second rolled over; the timer display is stale.
+                next_tick = start_time + math.floor(now - start_time) + 1
+                dirty = True
+        else:
+            handler = handlers.get(char)
+            if handler:
+                if handler():
                     # BUG FIX: Use 'continue' to restart the loop immediately.
                     # This ensures the win condition is checked before we try
                     # to access the next word, which might not exist.
                     continue
-                else:
-                    # Incorrect word - just clear the input for now
-                    user_input = ""
-            # Handle backspace for different OSs
-            elif char in ('\x08', '\x7f', '\b'):
-                user_input = user_input[:-1]
-            elif char == '\x03':  # Ctrl+C
-                raise KeyboardInterrupt
             # Ignore other special characters and add valid ones
-            elif char.isprintable():
-                user_input += char
-
-        # --- Render the Game Screen on Every Frame ---
-        clear_screen()
-        display_hud(level, current_score, current_lives, time_left, words_left_to_type)
-        display_boss(level)
-        
-        current_word = words_to_type[words_typed_count]
-        print(f"\nType this word: -> {current_word} <-")
-        # Display the user's current input as they type
-        print(f" > {user_input}", end='', flush=True)
-
-        # Control the loop speed to prevent high CPU usage
-        time.sleep(0.05)
+            elif char in _PRINTABLE:
+                # OR-ing bit 0x20 lowercases an ASCII letter without
+                # allocating an intermediate string.
+                user_buf.append(ord(char) | 0x20)
+                dirty = True
 
 def game():
     """The main function to run the game."""
@@ -410,10 +663,19 @@ def game():
     input()
 
     # --- Setup and Main Game Loop ---
+    # Prefetch every level's word list while still on the welcome
+    # screen, so no shuffling happens inside the timed loop and the
+    # cbreak-mode window starts with everything ready.
+    all_level_words = [get_word_list(lvl) for lvl in range(1, TOTAL_LEVELS + 1)]
+    # Warm up _tick with a throwaway call: when Numba is installed the
+    # first call triggers the JIT compile, which must not be charged
+    # against the first level's clock.
+    _tick(0.0, 0.0, 0, 0, TIME_PER_LEVEL)
     setup_terminal()
     try:
         while lives > 0 and level <= TOTAL_LEVELS:
-            level_passed, score, lives = play_level(level, score, lives)
+            level_passed, score, lives = play_level(
+                level, score, lives, all_level_words[level - 1])
             if level_passed:
                 level += 1
     except KeyboardInterrupt: